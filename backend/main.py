@@ -17,9 +17,11 @@ Endpoints
    Accepts a ``query`` parameter and returns a list
    of possible matches along with their titles. The
    search is a hybrid of simple substring matching
-   and fuzzy matching via Python's builtin sequence
-   matcher.  In production one would replace this
+   and fuzzy matching via RapidFuzz's C++ ratio
+   scorer.  In production one would replace this
    with a full‑text search engine or vector search.
+   ``/search/icd10/stream`` returns the same matches
+   as newline‑delimited JSON for bulk exports.
 
 2. **/search/modifier** – suggest CPT/HCPCS modifiers
    Based on keywords in the query, this endpoint
@@ -47,42 +49,66 @@ case in medical coding, but to provide a clear
 template upon which to build.  All data (codes,
 modifiers, pair edits) live in this file for
 simplicity; in a real application these would be
-loaded from a database.
+loaded from a database.  Full CMS exports of the
+ICD‑10‑CM and NCCI tables can be supplied as CSV
+files through the ``ICD10_CSV`` and ``NCCI_CSV``
+environment variables (see ``load_icd10`` and
+``load_ncci``).
 """
 
 from __future__ import annotations
 
+import bisect
+import contextlib
 import csv
-import difflib
+import functools
+import itertools
 import json
+import mmap
+import os
+import re
+import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Callable, Iterable, Iterator
 
+import numpy as np
+import orjson
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel
-
-
-app = FastAPI(title="Medical Coding Tool API")
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from rapidfuzz import fuzz, process
 
 
 # ---------------------------------------------------------------------------
 # Data models
+#
+# Models are frozen and their list fields are tuples: search results are
+# cached and shared between requests, so they must not be mutated after
+# construction.
 
 class ICDCode(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     code: str
     title: str
-    includes: List[str] | None = None
-    excludes: List[str] | None = None
-    synonyms: List[str] | None = None
+    includes: tuple[str, ...] | None = None
+    excludes: tuple[str, ...] | None = None
+    synonyms: tuple[str, ...] | None = None
 
 
 class Modifier(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     code: str
     title: str
     reason: str
 
 
 class NCCIResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     cpt_a: str
     cpt_b: str
     status: str
@@ -94,8 +120,8 @@ class NCCIResult(BaseModel):
 # In‑memory datasets
 
 # Load a small sample of ICD‑10‑CM codes.  A full implementation would load
-# the entire CMS distribution from CSV.  For demonstration we include a
-# handful of common diagnoses.
+# the entire CMS distribution from CSV (see ``ICD10_CSV`` below).  For
+# demonstration we include a handful of common diagnoses.
 SAMPLE_ICD10_DATA: List[ICDCode] = [
     ICDCode(
         code="M25.561",
@@ -177,9 +203,242 @@ NCCI_PAIRS: Dict[str, Dict[str, Dict[str, Any]]] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Dataset loading
+#
+# The sample tables above are enough for a demo, but the full CMS
+# distributions (~70k ICD‑10‑CM codes, ~1M NCCI PTP pairs) are far too large
+# to keep as Python literals.  When ``ICD10_CSV`` / ``NCCI_CSV`` point at CSV
+# exports they are loaded instead.  ICD rows are stored as plain string
+# columns and an ``ICDCode`` is only built for the rows a search returns.
+
+ICD10_CSV = os.environ.get("ICD10_CSV")
+NCCI_CSV = os.environ.get("NCCI_CSV")
+
+# code, title, includes, excludes, synonyms -- one list per field, row‑aligned
+ICDColumns = tuple[List[str], List[str], List[tuple[str, ...]], List[tuple[str, ...]], List[tuple[str, ...]]]
+
+
+def _read_csv(path: Path) -> Iterator[List[str]]:
+    """Yield the rows of a UTF‑8 CSV file, header included.
+
+    The file is memory mapped and fed to ``csv.reader`` line by line, so
+    its contents are never copied into one large Python string.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = (line.decode("utf-8-sig") for line in iter(mm.readline, b""))
+            yield from csv.reader(lines)
+
+
+def _split_multi(value: str) -> tuple[str, ...]:
+    return tuple(part.strip() for part in value.split("|") if part.strip())
+
+
+@functools.lru_cache(maxsize=None)
+def load_icd10(path: Path) -> ICDColumns:
+    """Load ICD‑10‑CM codes from a CSV file into parallel columns.
+
+    The file must have a header row with at least ``code`` and ``title``
+    columns.  Optional ``includes``, ``excludes`` and ``synonyms`` columns
+    hold ``|``‑separated lists.  The file is parsed only once per path.
+    """
+    rows = _read_csv(path)
+    header = [name.strip().lower() for name in next(rows, [])]
+    code_i, title_i = header.index("code"), header.index("title")
+    extra_i = [header.index(name) if name in header else None for name in ("includes", "excludes", "synonyms")]
+    codes: List[str] = []
+    titles: List[str] = []
+    extras: tuple[List[tuple[str, ...]], ...] = ([], [], [])
+    for row in rows:
+        if not row:
+            continue
+        codes.append(sys.intern(row[code_i].strip()))
+        titles.append(row[title_i].strip())
+        for column, i in zip(extras, extra_i):
+            column.append(_split_multi(row[i]) if i is not None and i < len(row) else ())
+    return codes, titles, *extras
+
+
+@functools.lru_cache(maxsize=None)
+def load_ncci(path: Path) -> Dict[tuple[str, str], Dict[str, Any]]:
+    """Load NCCI pair edits from a CSV file into a flat pair‑keyed dict.
+
+    The file must have a header row with ``cpt_a``, ``cpt_b``, ``status``,
+    ``message`` and ``modifier_required`` (``1``/``0``) columns.  Keys are
+    the sorted code pair, matching ``_NCCI_FLAT``.  Codes and statuses are
+    interned: the same few thousand CPT codes recur across every pair, so
+    each distinct string is stored only once.
+    """
+    rows = _read_csv(path)
+    header = [name.strip().lower() for name in next(rows, [])]
+    a_i, b_i, status_i, message_i, modifier_i = (
+        header.index(name) for name in ("cpt_a", "cpt_b", "status", "message", "modifier_required")
+    )
+    pairs: Dict[tuple[str, str], Dict[str, Any]] = {}
+    for row in rows:
+        if not row:
+            continue
+        code_a, code_b = sys.intern(row[a_i].strip()), sys.intern(row[b_i].strip())
+        pairs[(min(code_a, code_b), max(code_a, code_b))] = {
+            "status": sys.intern(row[status_i].strip()),
+            "message": row[message_i].strip(),
+            "modifier_required": row[modifier_i].strip().lower() in ("1", "true", "yes"),
+        }
+    return pairs
+
+
+_ICD_COLUMNS: ICDColumns
+if ICD10_CSV:
+    _ICD_COLUMNS = load_icd10(Path(ICD10_CSV))
+else:
+    _ICD_COLUMNS = (
+        [entry.code for entry in SAMPLE_ICD10_DATA],
+        [entry.title for entry in SAMPLE_ICD10_DATA],
+        [tuple(entry.includes or ()) for entry in SAMPLE_ICD10_DATA],
+        [tuple(entry.excludes or ()) for entry in SAMPLE_ICD10_DATA],
+        [tuple(entry.synonyms or ()) for entry in SAMPLE_ICD10_DATA],
+    )
+_ICD_CODES, _ICD_TITLES, _ICD_INCLUDES, _ICD_EXCLUDES, _ICD_SYNONYMS = _ICD_COLUMNS
+
+# The datasets are immutable, so the lower‑cased text the search compares
+# against is computed once here rather than on every request.  Code and title
+# are row‑aligned with the columns above; the title column also lets the
+# fuzzy scorer cover the whole table in one C++ call.
+_ICD_CODES_LC: List[str] = [code.lower() for code in _ICD_CODES]
+_ICD_TITLES_LC: List[str] = [title.lower() for title in _ICD_TITLES]
+
+
+def _flatten_sections(column: List[tuple[str, ...]]) -> tuple[List[str], np.ndarray]:
+    """Flatten a multi‑valued column into lower‑cased texts and their row ids."""
+    rows = np.repeat(np.arange(len(column)), [len(sections) for sections in column])
+    return [s.lower() for sections in column for s in sections], rows
+
+
+def _haystack(texts: List[str]) -> tuple[str, List[int]]:
+    """Join ``texts`` into one NUL‑separated string for ``_find_all``.
+
+    Returns the joined string and the offset each text starts at, followed
+    by a sentinel one past the end.
+    """
+    return _HAYSTACK_SEP.join(texts), list(itertools.accumulate((len(t) + 1 for t in texts), initial=0))
+
+
+def _trigram_index(texts: List[str]) -> Dict[str, np.ndarray]:
+    """Map every 3‑gram in ``texts`` to the sorted ids of the texts containing it."""
+    postings: Dict[str, List[int]] = {}
+    for j, text in enumerate(texts):
+        for gram in {text[k:k + _GRAM] for k in range(len(text) - _GRAM + 1)}:
+            postings.setdefault(gram, []).append(j)
+    return {gram: np.array(ids, dtype=np.uint32) for gram, ids in postings.items()}
+
+
+# Substring screening runs over one joined haystack per searchable field
+# rather than testing every text separately: a single C‑level ``str.find``
+# sweep finds every text containing the query.  Queries of at least
+# ``_GRAM`` characters first intersect the posting lists of their 3‑grams,
+# so only the texts that could contain the query are checked at all.  Each
+# field is stored as ``(weight, haystack, starts, rows, grams)`` where
+# ``rows[j]`` is the row that text ``j`` belongs to; multi‑valued sections
+# score once per matching section.
+_HAYSTACK_SEP = "\x00"
+_GRAM = 3
+_ICD_ROW_IDS = np.arange(len(_ICD_CODES))
+_ICD_INCLUDES_LC, _ICD_INCLUDES_ROW = _flatten_sections(_ICD_INCLUDES)
+_ICD_EXCLUDES_LC, _ICD_EXCLUDES_ROW = _flatten_sections(_ICD_EXCLUDES)
+_ICD_SYNONYMS_LC, _ICD_SYNONYMS_ROW = _flatten_sections(_ICD_SYNONYMS)
+_ICD_SEARCH_FIELDS: List[tuple[float, str, List[int], np.ndarray, Dict[str, np.ndarray]]] = [
+    (weight, *_haystack(texts), rows, _trigram_index(texts))
+    for weight, texts, rows in (
+        (2.0, _ICD_CODES_LC, _ICD_ROW_IDS),
+        (1.5, _ICD_TITLES_LC, _ICD_ROW_IDS),
+        (1.0, _ICD_INCLUDES_LC, _ICD_INCLUDES_ROW),
+        (0.5, _ICD_EXCLUDES_LC, _ICD_EXCLUDES_ROW),
+        (1.0, _ICD_SYNONYMS_LC, _ICD_SYNONYMS_ROW),
+    )
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _icd_entry(i: int) -> ICDCode:
+    """Build the ``ICDCode`` for row ``i`` of the ICD columns."""
+    return ICDCode(
+        code=_ICD_CODES[i],
+        title=_ICD_TITLES[i],
+        includes=_ICD_INCLUDES[i] or None,
+        excludes=_ICD_EXCLUDES[i] or None,
+        synonyms=_ICD_SYNONYMS[i] or None,
+    )
+
+
+# Every ICD row serialised to JSON once at load.  The catalogue is immutable,
+# so a row's JSON is a constant and search responses are assembled by
+# joining these byte strings; no model is built or dumped per request.  The
+# keys mirror ``ICDCode.model_dump()``.
+_ICD_JSON: List[bytes] = [
+    orjson.dumps({
+        "code": code,
+        "title": title,
+        "includes": list(includes) or None,
+        "excludes": list(excludes) or None,
+        "synonyms": list(synonyms) or None,
+    })
+    for code, title, includes, excludes, synonyms in zip(*_ICD_COLUMNS)
+]
+
+
+# NCCI edits flattened to a single dict keyed by the sorted code pair, so
+# either ordering of a pair resolves with one lookup.
+_NCCI_FLAT: Dict[tuple[str, str], Dict[str, Any]] = load_ncci(Path(NCCI_CSV)) if NCCI_CSV else {
+    (min(code_a, code_b), max(code_a, code_b)): rec
+    for code_a, partners in NCCI_PAIRS.items()
+    for code_b, rec in partners.items()
+}
+
+# Modifiers indexed by code for constant‑time lookup.
+_MOD_BY_CODE: Dict[str, Modifier] = {mod.code: mod for mod in MODIFIER_TABLE}
+_MOD_JSON: Dict[str, bytes] = {mod.code: orjson.dumps(mod.model_dump()) for mod in MODIFIER_TABLE}
+
+# Keyword routing for ``modifier_suggestions``.  Every keyword group is one
+# named alternative of a single pattern so the query is scanned once.  The
+# group order below is also the order suggestions are returned in.
+_MODIFIER_GROUPS: Dict[str, str] = {
+    "m50": "50",  # bilateral procedures
+    "mLT": "LT",  # left side
+    "mRT": "RT",  # right side
+    "m76": "76",  # repeat
+    "m59": "59",  # distinct or separate
+    "m25": "25",  # E/M separate from procedure
+    "m26": "26",  # professional component
+    "mTC": "TC",  # technical component
+}
+_MODIFIER_RE = re.compile(
+    r"(?P<m50>bilateral|both sides|both limbs)"
+    r"|(?P<mLT>\bleft\b|\blt\b)"
+    r"|(?P<mRT>\bright\b|\brt\b)"
+    r"|(?P<m76>repeat|again)"
+    r"|(?P<m59>distinct|different site|separate session)"
+    r"|(?P<m25>evaluation|e/m)"
+    r"|(?P<m26>interpretation|professional)"
+    r"|(?P<mTC>equipment|technical)",
+    re.IGNORECASE,
+)
+
+
 # ---------------------------------------------------------------------------
 # Utility functions
 
+def normalize_query(query: str) -> str:
+    """Lower‑case and trim a free‑text query.
+
+    The endpoints call this once per request and hand the result to the
+    cached helpers below, which expect an already normalised query.
+    """
+    return query.lower().strip()
+
+
 def icd_search(query: str, limit: int = 5) -> List[ICDCode]:
     """Return a list of ICD codes best matching the given query.
 
@@ -189,35 +448,106 @@ def icd_search(query: str, limit: int = 5) -> List[ICDCode]:
     score in descending order.  Only the top ``limit`` results are
     returned.
     """
-    query_lower = query.lower().strip()
-    scored: List[tuple[ICDCode, float]] = []
-    for entry in SAMPLE_ICD10_DATA:
-        score = 0.0
-        # Direct substring match in code or title
-        if query_lower in entry.code.lower():
-            score += 2.0
-        if query_lower in entry.title.lower():
-            score += 1.5
-        # Include/exclude text
-        for section in (entry.includes or []):
-            if query_lower in section.lower():
-                score += 1.0
-        for section in (entry.excludes or []):
-            if query_lower in section.lower():
-                score += 0.5
-        # Synonyms
-        for syn in (entry.synonyms or []):
-            if query_lower in syn.lower():
-                score += 1.0
-        # Fuzzy match ratio on title
-        ratio = difflib.SequenceMatcher(None, query_lower, entry.title.lower()).ratio()
-        score += ratio
-        if score > 0:
-            scored.append((entry, score))
-    # Sort by score descending
-    scored.sort(key=lambda x: x[1], reverse=True)
-    # Return top N entries
-    return [item[0] for item in scored[:limit]]
+    return [_icd_entry(i) for i in _icd_ids_cached(normalize_query(query), limit).tolist()]
+
+
+# The search helpers below are pure functions of their (normalised)
+# arguments and the in‑memory datasets, so results are memoised.  Typeahead
+# clients resend the same prefixes constantly and each repeat becomes a
+# single dict lookup.  Cached values are immutable (tuples, or read‑only
+# arrays) so callers cannot mutate a shared result; call ``.cache_clear()``
+# on these functions whenever the underlying datasets are reloaded.
+
+@functools.lru_cache(maxsize=1024)
+def _icd_ids_cached(query_lower: str, limit: int) -> np.ndarray:
+    # Row ids are kept as a compact int32 array: at most
+    # ``ICD_MAX_PAGES * ICD_MAX_PAGE_SIZE`` ids, i.e. a few KB per entry.
+    ids = _icd_rank(query_lower, limit).astype(np.int32)
+    ids.flags.writeable = False
+    return ids
+
+
+def _icd_rank(query_lower: str, limit: int) -> np.ndarray:
+    """Return the row ids of the top ``limit`` matches, best first."""
+    score = np.zeros(len(_ICD_CODES_LC))
+    # Substring matches in code, title, include/exclude text and synonyms.
+    # A query containing the separator cannot match inside a single text.
+    if _HAYSTACK_SEP not in query_lower:
+        for weight, haystack, starts, rows, grams in _ICD_SEARCH_FIELDS:
+            np.add.at(score, rows[_field_hits(query_lower, haystack, starts, grams)], weight)
+    # Fuzzy match ratio on title.  The ratio adds at most 1.0, so a row whose
+    # substring score is more than 1.0 below the ``limit``‑th best can never
+    # reach the top ``limit``; only rows inside that band are fuzzy scored.
+    n = score.size
+    if 0 < limit < n:
+        floor = np.partition(score, n - limit)[n - limit] - 1.0
+        band = np.flatnonzero(score >= floor)
+    else:
+        band = np.arange(n)
+    if band.size == n:
+        score += process.cdist([query_lower], _ICD_TITLES_LC, scorer=fuzz.ratio)[0] / 100.0
+    elif band.size:
+        titles = [_ICD_TITLES_LC[i] for i in band.tolist()]
+        score[band] += process.cdist([query_lower], titles, scorer=fuzz.ratio)[0] / 100.0
+    # Return the top N entries by score
+    top = _top_k(score, limit)
+    return top[score[top] > 0]
+
+
+def _top_k(score: np.ndarray, k: int) -> np.ndarray:
+    """Return the indices of the ``k`` highest scores, best first.
+
+    ``np.partition`` finds the ``k``‑th best score in linear time, so only
+    the ``k`` selected rows are sorted rather than the whole table.  Ties
+    are broken by row order, including at the cut‑off.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < score.size:
+        kth = np.partition(score, score.size - k)[score.size - k]
+        above = np.flatnonzero(score > kth)
+        top = np.concatenate((above, np.flatnonzero(score == kth)[:k - above.size]))
+    else:
+        top = np.arange(score.size)
+    return top[np.lexsort((top, -score[top]))]
+
+
+def _field_hits(query_lower: str, haystack: str, starts: List[int], grams: Dict[str, np.ndarray]) -> List[int]:
+    """Return the index of every text in a search field containing the query.
+
+    The texts sharing all of the query's 3‑grams form a shortlist, and only
+    those are checked for the full substring.  Queries shorter than a
+    3‑gram fall back to a sweep over the whole haystack.
+    """
+    if len(query_lower) < _GRAM:
+        return _find_all(query_lower, haystack, starts)
+    postings = []
+    for gram in {query_lower[k:k + _GRAM] for k in range(len(query_lower) - _GRAM + 1)}:
+        if gram not in grams:
+            return []
+        postings.append(grams[gram])
+    postings.sort(key=len)
+    candidates = functools.reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), postings)
+    find = haystack.find
+    return [j for j in candidates.tolist() if find(query_lower, starts[j], starts[j + 1] - 1) != -1]
+
+
+def _find_all(query_lower: str, haystack: str, starts: List[int]) -> List[int]:
+    """Return the index of every text in ``haystack`` containing the query.
+
+    After a hit the scan resumes at the start of the next text, so each
+    text is reported at most once and in order.
+    """
+    hits: List[int] = []
+    if len(starts) < 2:
+        return hits
+    find = haystack.find
+    pos = find(query_lower)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        hits.append(i)
+        pos = find(query_lower, starts[i + 1])
+    return hits
 
 
 def modifier_suggestions(query: str) -> List[Modifier]:
@@ -227,39 +557,13 @@ def modifier_suggestions(query: str) -> List[Modifier]:
     could use natural language understanding and context from
     the encounter to drive a rule engine.
     """
-    q = query.lower()
-    suggestions: List[Modifier] = []
-    # Bilateral procedures
-    if any(word in q for word in ["bilateral", "both sides", "both limbs"]):
-        suggestions.append(next(mod for mod in MODIFIER_TABLE if mod.code == "50"))
-    # Left or right
-    if "left" in q or "lt" in q:
-        suggestions.append(next(mod for mod in MODIFIER_TABLE if mod.code == "LT"))
-    if "right" in q or "rt" in q:
-        suggestions.append(next(mod for mod in MODIFIER_TABLE if mod.code == "RT"))
-    # Repeat
-    if "repeat" in q or "again" in q:
-        suggestions.append(next(mod for mod in MODIFIER_TABLE if mod.code == "76"))
-    # Distinct or separate
-    if any(word in q for word in ["distinct", "different site", "separate session"]):
-        suggestions.append(next(mod for mod in MODIFIER_TABLE if mod.code == "59"))
-    # E/M separate from procedure
-    if "evaluation" in q or "e/m" in q:
-        suggestions.append(next(mod for mod in MODIFIER_TABLE if mod.code == "25"))
-    # Professional component
-    if "interpretation" in q or "professional" in q:
-        suggestions.append(next(mod for mod in MODIFIER_TABLE if mod.code == "26"))
-    # Technical component
-    if "equipment" in q or "technical" in q:
-        suggestions.append(next(mod for mod in MODIFIER_TABLE if mod.code == "TC"))
-    # Remove duplicates while preserving order
-    seen = set()
-    unique: List[Modifier] = []
-    for suggestion in suggestions:
-        if suggestion.code not in seen:
-            seen.add(suggestion.code)
-            unique.append(suggestion)
-    return unique
+    return list(_modifier_suggestions_cached(normalize_query(query)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _modifier_suggestions_cached(q: str) -> tuple[Modifier, ...]:
+    found = {match.lastgroup for match in _MODIFIER_RE.finditer(q)}
+    return tuple(_MOD_BY_CODE[code] for group, code in _MODIFIER_GROUPS.items() if group in found)
 
 
 def check_ncci_pair(code_a: str, code_b: str) -> NCCIResult:
@@ -274,74 +578,145 @@ def check_ncci_pair(code_a: str, code_b: str) -> NCCIResult:
     # Normalize to string numbers (strip decimals and whitespace)
     code_a = code_a.strip()
     code_b = code_b.strip()
-    # Try direct match in sample table
-    if code_a in NCCI_PAIRS and code_b in NCCI_PAIRS[code_a]:
-        rec = NCCI_PAIRS[code_a][code_b]
-        return NCCIResult(
-            cpt_a=code_a,
-            cpt_b=code_b,
-            status=rec["status"],
-            message=rec["message"],
-            modifier_required=rec["modifier_required"],
-        )
-    # Check reversed pair
-    if code_b in NCCI_PAIRS and code_a in NCCI_PAIRS[code_b]:
-        rec = NCCI_PAIRS[code_b][code_a]
+    rec = _NCCI_FLAT.get((min(code_a, code_b), max(code_a, code_b)))
+    if rec is None:
+        # Default: allowed
         return NCCIResult(
             cpt_a=code_a,
             cpt_b=code_b,
-            status=rec["status"],
-            message=rec["message"],
-            modifier_required=rec["modifier_required"],
+            status="allowed",
+            message="No known NCCI bundling issues between these CPT codes.",
+            modifier_required=False,
         )
-    # Default: allowed
     return NCCIResult(
         cpt_a=code_a,
         cpt_b=code_b,
-        status="allowed",
-        message="No known NCCI bundling issues between these CPT codes.",
-        modifier_required=False,
+        status=rec["status"],
+        message=rec["message"],
+        modifier_required=rec["modifier_required"],
     )
 
 
 # ---------------------------------------------------------------------------
 # API endpoints
+#
+# The handlers are ``async`` so cache hits are served directly on the event
+# loop without a threadpool hop.  Cache misses are different: ranking the
+# full CMS table takes tens of milliseconds for short queries, so that work
+# is handed to the threadpool and the loop keeps serving other requests.
+#
+# The models returned by the helpers are built from trusted in‑memory data,
+# so the data endpoints serialise them directly with orjson instead of
+# declaring a ``response_model``; FastAPI would otherwise validate and
+# serialise every object a second time.  ``responses=`` keeps the schema in
+# the OpenAPI docs.
+#
+# Every endpoint is a pure function of its query string, so the serialised
+# bytes are also kept in a TTL cache: a repeated GET skips scoring, model
+# dumping and JSON encoding altogether.  The cache is sized by total body
+# bytes rather than entry count, so large responses cannot exhaust memory.
+
+_RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+_RESPONSE_CACHE: TTLCache[str, bytes] = TTLCache(maxsize=_RESPONSE_CACHE_BYTES, ttl=300, getsizeof=len)
+
+
+async def _cached_json(key: str, build: Callable[[], bytes]) -> Response:
+    """Return the JSON body cached under ``key``, building it on a miss.
+
+    ``build`` runs in the threadpool so a slow miss never blocks the loop.
+    """
+    body = _RESPONSE_CACHE.get(key)
+    if body is None:
+        body = _RESPONSE_CACHE[key] = await run_in_threadpool(build)
+    return Response(content=body, media_type="application/json")
+
+
+def _json_array(items: Iterable[bytes]) -> bytes:
+    """Join already serialised JSON values into a JSON array."""
+    return b"[" + b",".join(items) + b"]"
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm the lazily initialised request paths before serving traffic.
+
+    NumPy, RapidFuzz, the regex engine and orjson all do some one‑off
+    setup on first use.  Running one synthetic request through the same
+    helpers the endpoints call keeps that cost off the first real request.
+    """
+    _json_array(_ICD_JSON[i] for i in _icd_rank(normalize_query("pain"), 5 * ICD_MAX_PAGES))
+    _json_array(_MOD_JSON[mod.code] for mod in _modifier_suggestions_cached(normalize_query("bilateral left")))
+    orjson.dumps(check_ncci_pair("11719", "11720").model_dump())
+    yield
+
+
+# Responses are rendered with orjson, which writes UTF‑8 bytes directly
+# instead of going through ``json.dumps`` and a separate encode step.
+app = FastAPI(title="Medical Coding Tool API", default_response_class=ORJSONResponse, lifespan=lifespan)
+
 
-@app.get("/search/icd10", response_model=List[ICDCode])
-def search_icd10(query: str = Query(..., min_length=1, description="Free‑text clinical description to match"), limit: int = 5) -> List[ICDCode]:
+# ICD searches rank enough rows for this many pages up front, so paging
+# through one query reuses a single cached result instead of re‑scoring.
+# The page size is capped so a cached result stays small.
+ICD_MAX_PAGES = 10
+ICD_MAX_PAGE_SIZE = 100
+
+
+@app.get("/search/icd10", response_model=None, responses={200: {"model": List[ICDCode]}})
+async def search_icd10(query: str = Query(..., min_length=1, description="Free‑text clinical description to match"), limit: int = Query(5, ge=1, le=ICD_MAX_PAGE_SIZE, description="Page size"), page: int = Query(0, ge=0, lt=ICD_MAX_PAGES, description="Zero‑based page number")) -> Response:
     """Search the sample ICD‑10‑CM database.
 
-    Returns up to ``limit`` matching codes.  If no matches are
-    found an empty list is returned.  Clients should handle the
-    case where no suggestions are appropriate.
+    Returns up to ``limit`` matching codes from the requested ``page``.
+    If no matches are found an empty list is returned.  Clients should
+    handle the case where no suggestions are appropriate.
     """
-    results = icd_search(query, limit=limit)
-    return results
+    q = normalize_query(query)
+
+    def build() -> bytes:
+        shortlist = _icd_ids_cached(q, limit * ICD_MAX_PAGES)
+        return _json_array(_ICD_JSON[i] for i in shortlist[page * limit:(page + 1) * limit].tolist())
+
+    return await _cached_json(f"icd10:{limit}:{page}:{q}", build)
+
 
+@app.get("/search/icd10/stream", response_class=StreamingResponse, responses={200: {"content": {"application/x-ndjson": {}}}})
+async def search_icd10_stream(query: str = Query(..., min_length=1, description="Free‑text clinical description to match"), limit: int = Query(100, ge=1, description="Maximum number of matches")) -> StreamingResponse:
+    """Stream ICD‑10‑CM matches as newline‑delimited JSON.
 
-@app.get("/search/modifier", response_model=List[Modifier])
-def search_modifier(query: str = Query(..., min_length=1, description="Description of the clinical scenario")) -> List[Modifier]:
+    Intended for bulk exports with a large ``limit``: each match is
+    written as soon as it is produced instead of building the whole JSON
+    array first.
+    """
+    ids = await run_in_threadpool(_icd_rank, normalize_query(query), limit)
+    rows = (_ICD_JSON[i] + b"\n" for i in ids.tolist())
+    return StreamingResponse(rows, media_type="application/x-ndjson")
+
+
+@app.get("/search/modifier", response_model=None, responses={200: {"model": List[Modifier]}})
+async def search_modifier(query: str = Query(..., min_length=1, description="Description of the clinical scenario")) -> Response:
     """Suggest modifiers based on the provided clinical description.
     
     The suggestions are derived from simple keyword logic.  If the
     description does not match any known pattern the result will be
     empty.
     """
-    return modifier_suggestions(query)
+    q = normalize_query(query)
+    return await _cached_json(f"modifier:{q}", lambda: _json_array(_MOD_JSON[mod.code] for mod in _modifier_suggestions_cached(q)))
 
 
-@app.get("/check/ncci", response_model=NCCIResult)
-def check_ncci(cpt_a: str = Query(..., min_length=5, max_length=5, description="First CPT code"), cpt_b: str = Query(..., min_length=5, max_length=5, description="Second CPT code")) -> NCCIResult:
+@app.get("/check/ncci", response_model=None, responses={200: {"model": NCCIResult}})
+async def check_ncci(cpt_a: str = Query(..., min_length=5, max_length=5, description="First CPT code"), cpt_b: str = Query(..., min_length=5, max_length=5, description="Second CPT code")) -> Response:
     """Check a pair of CPT codes against the sample NCCI table.
 
     The two codes are treated as an unordered pair; if they exist in
     our sample table the corresponding status and message are
     returned.  Otherwise the pair is assumed to be allowed.
     """
-    return check_ncci_pair(cpt_a, cpt_b)
+    return await _cached_json(f"ncci:{cpt_a}:{cpt_b}", lambda: orjson.dumps(check_ncci_pair(cpt_a, cpt_b).model_dump()))
 
 
 @app.get("/health")
-def health() -> Dict[str, str]:
+async def health() -> Dict[str, str]:
     """Healthcheck endpoint."""
     return {"status": "ok"}
+